@@ -1,9 +1,14 @@
 # handlers.py
+import atexit
 import contextlib
 import functools
+import hashlib
 import json
 import logging
+import logging.handlers
 import os
+import queue
+import random
 import re
 import socket
 import threading
@@ -12,24 +17,43 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import List, Optional
 
-from netmiko import ConnectHandler
-from netmiko.exceptions import (
-    ConfigInvalidException,
-    NetmikoAuthenticationException,
-    NetmikoTimeoutException,
-)
-from paramiko.ssh_exception import SSHException
 from PyQt6 import QtCore
 
-# Configure logging
-logging.basicConfig(
-    filename="netmiko.log",
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s: %(message)s",
+# netmiko (and paramiko with it) loads every platform driver on import, so it
+# is imported where connections are made rather than at GUI startup.
+
+# Configure logging. Worker threads only enqueue records; a background
+# listener writes them to the file in blocks, and errors flush immediately.
+# The file rotates at 10MB so the Log Viewer never has to load an unbounded file.
+_log_file_handler = logging.handlers.RotatingFileHandler(
+    "netmiko.log", maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"
+)
+_log_file_handler.setFormatter(
+    logging.Formatter("%(asctime)s %(levelname)s [%(threadName)s]: %(message)s")
+)
+_log_buffer = logging.handlers.MemoryHandler(
+    capacity=256,
+    flushLevel=logging.ERROR,
+    target=_log_file_handler,
 )
+_log_queue = queue.Queue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_buffer)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# QueueHandler formats records before queueing them; keep just the message so
+# the file handler's formatter adds the only prefix
+_log_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[_log_queue_handler])
 logger = logging.getLogger("netmiko")
 
 
+def flush_log():
+    """Write any queued or buffered log records to netmiko.log."""
+    _log_queue.join()  # Wait for the listener to drain the queue
+    _log_buffer.flush()
+
+
 def log_execution_time(func):
     """Decorator to log function execution time."""
     @functools.wraps(func)
@@ -39,41 +63,101 @@ def log_execution_time(func):
             result = func(*args, **kwargs)
             execution_time = time.perf_counter() - start_time
             logger.info(
-                f"{func.__name__} completed in {execution_time:.2f} seconds"
+                "%s completed in %.2f seconds", func.__name__, execution_time
             )
             return result
         except Exception as e:
             execution_time = time.perf_counter() - start_time
             logger.error(
-                f"{func.__name__} failed after {execution_time:.2f} seconds: {e}"
+                "%s failed after %.2f seconds: %s", func.__name__, execution_time, e
             )
             raise
     return wrapper
 
 
-def retry_on_exception(retries=3, delay=1):
-    """Decorator to retry a function on exception."""
+def retry_on_exception(retries=3, delay=1, stop_event_attr=None):
+    """Decorator to retry a function on exception with exponential backoff.
+
+    ``delay`` is the base of the backoff; each retry waits roughly twice as
+    long as the previous one, plus jitter. For methods, ``stop_event_attr``
+    names a ``threading.Event`` on the instance that cuts the wait short and
+    abandons the retries when set.
+    """
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            stop_event = getattr(args[0], stop_event_attr) if stop_event_attr else None
             for attempt in range(retries):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
                     if attempt == retries - 1:
                         logger.error(
-                            f"Failed after {retries} attempts: {e}"
+                            "Failed after %d attempts: %s", retries, e
                         )
                         raise
                     logger.warning(
-                        f"Attempt {attempt + 1} failed: {e}. Retrying..."
+                        "Attempt %d failed: %s. Retrying...", attempt + 1, e
                     )
-                    time.sleep(delay)
+                    wait = backoff_delay(attempt + 1, base=delay)
+                    if stop_event is None:
+                        time.sleep(wait)
+                    elif stop_event.wait(wait):
+                        return None
             return None
         return wrapper
     return decorator
 
 
+NETWORK_SETTINGS_FILE = "network_settings.json"
+
+
+@functools.lru_cache(maxsize=1)
+def _read_network_settings(mtime_ns: Optional[int]) -> dict:
+    """Parse network settings; cached on the file's mtime so runs reuse it."""
+    default_settings = {
+        'ssh_timeout': 3,
+        'conn_retry': 30,
+        'cmd_timeout': 120,
+        'auth_timeout': 30,
+        'max_threads': 10,
+        'batch_size': 5
+    }
+
+    try:
+        if mtime_ns is not None:
+            with open(NETWORK_SETTINGS_FILE, 'r') as f:
+                settings = json.load(f)
+                return {
+                    'ssh_timeout': settings.get('ssh_timeout', default_settings['ssh_timeout']),
+                    'conn_retry': settings.get('conn_retry', default_settings['conn_retry']),
+                    'cmd_timeout': settings.get('cmd_timeout', default_settings['cmd_timeout']),
+                    'auth_timeout': settings.get('auth_timeout', default_settings['auth_timeout']),
+                    'max_threads': settings.get('max_threads', default_settings['max_threads']),
+                    'batch_size': settings.get('batch_size', default_settings['batch_size'])
+                }
+    except Exception as e:
+        logger.error("Error loading network settings: %s", e)
+
+    return default_settings
+
+
+def backoff_delay(attempt, base=1.0, cap=30.0, jitter=1.0):
+    """Return a capped exponential backoff delay (seconds) with random jitter."""
+    return min(cap, base * 2 ** (attempt - 1)) + random.uniform(0, jitter)
+
+
+@functools.lru_cache(maxsize=4096)
+def resolve_host(host: str) -> tuple:
+    """Resolve a hostname to its IP addresses in resolver order.
+
+    Answers are cached for later dials; the cache is cleared at the start of
+    every run so DNS changes are picked up without restarting the app.
+    """
+    infos = socket.getaddrinfo(host, 22, type=socket.SOCK_STREAM)
+    return tuple(dict.fromkeys(info[4][0] for info in infos))
+
+
 @dataclass(frozen=True)
 class DeviceBatch:
     """Immutable device batch configuration."""
@@ -89,12 +173,178 @@ class DeviceBatch:
             raise ValueError("Command list cannot be empty")
 
 
+def enable_tcp_keepalive(net_connect):
+    """Enable TCP keepalive on the SSH socket so idle sessions aren't dropped."""
+    try:
+        sock = net_connect.remote_conn.get_transport().sock
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Probe timings are only tunable where the platform exposes them
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 20)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+    except (AttributeError, OSError) as e:
+        logger.warning("Could not enable TCP keepalive: %s", e)
+
+
+# Connection pool limits
+POOL_IDLE_TIMEOUT = 300  # Seconds an unused session stays logged in
+POOL_MAX_AGE = 3600  # Seconds after which a session is not reused
+POOL_MAX_SIZE = 64  # Idle sessions kept; least recently used are closed first
+
+
+@dataclass
+class PooledSession:
+    """A checked-out pooled connection and whether it may be reused."""
+    connection: object
+    clean: bool = True
+
+
+class ConnectionPool:
+    """Thread-safe cache of live Netmiko connections for reuse across runs."""
+
+    def __init__(
+        self,
+        idle_timeout: float = POOL_IDLE_TIMEOUT,
+        max_age: float = POOL_MAX_AGE,
+        max_size: int = POOL_MAX_SIZE,
+    ):
+        """Initialize the pool.
+
+        Args:
+            idle_timeout: Seconds an unused connection is kept before eviction
+            max_age: Seconds after which a connection is not reused
+            max_size: Maximum number of idle connections kept in the pool
+        """
+        self.idle_timeout = idle_timeout
+        self.max_age = max_age
+        self.max_size = max_size
+        self._connections = {}
+        self._opened_at = {}  # id(connection) -> monotonic open time
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        # Sessions left over from the last run are logged out in the
+        # background instead of staying open until the app exits
+        threading.Thread(
+            target=self._sweep, name="connection-pool-sweeper", daemon=True
+        ).start()
+
+    @staticmethod
+    def _key(device_info: dict) -> tuple:
+        """Build the pool key identifying a device session.
+
+        The credentials are part of the key (hashed, so they aren't kept in
+        plain text twice) so a run with a different or wrong password never
+        reuses a session that authenticated with the old one.
+        """
+        credentials = hashlib.sha256(
+            "\0".join(
+                (device_info.get("password") or "", device_info.get("secret") or "")
+            ).encode("utf-8")
+        ).hexdigest()
+        return (
+            device_info["host"],
+            device_info.get("port", 22),
+            device_info.get("username"),
+            device_info["device_type"],
+            credentials,
+        )
+
+    def acquire(self, device_info: dict):
+        """Check out a live pooled connection, or open a new one."""
+        key = self._key(device_info)
+        # Pop rather than get so a session is never shared between threads
+        with self._lock:
+            entry = self._connections.pop(key, None)
+
+        if entry:
+            net_connect, last_used = entry
+            now = time.monotonic()
+            opened_at = self._opened_at.get(id(net_connect), now)
+            if (
+                now - last_used < self.idle_timeout
+                and now - opened_at < self.max_age
+                and net_connect.is_alive()
+            ):
+                logger.info("Reusing pooled connection to %s.", key[0])
+                return net_connect
+            self.discard(net_connect)
+
+        from netmiko import ConnectHandler
+
+        net_connect = ConnectHandler(**device_info)
+        enable_tcp_keepalive(net_connect)
+        with self._lock:
+            self._opened_at[id(net_connect)] = time.monotonic()
+        return net_connect
+
+    def release(self, device_info: dict, net_connect) -> None:
+        """Return a connection to the pool for later reuse."""
+        key = self._key(device_info)
+        with self._lock:
+            stale = self._connections.pop(key, None)
+            self._connections[key] = (net_connect, time.monotonic())
+            stale_connections = [stale[0]] if stale else []
+            # Dicts keep insertion order, so the first entries are the
+            # least recently released sessions
+            while len(self._connections) > self.max_size:
+                oldest = next(iter(self._connections))
+                stale_connections.append(self._connections.pop(oldest)[0])
+        for connection in stale_connections:
+            self.discard(connection)
+        self.evict_idle()
+
+    def evict_idle(self) -> None:
+        """Disconnect pooled connections unused for longer than idle_timeout."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                key for key, (_, last_used) in self._connections.items()
+                if now - last_used >= self.idle_timeout
+            ]
+            stale = [self._connections.pop(key)[0] for key in expired]
+        for net_connect in stale:
+            self.discard(net_connect)
+
+    def _sweep(self) -> None:
+        """Periodically evict idle connections until the pool is closed."""
+        while not self._closed.wait(self.idle_timeout / 5):
+            self.evict_idle()
+
+    def discard(self, net_connect) -> None:
+        """Disconnect a connection without returning it to the pool."""
+        with self._lock:
+            self._opened_at.pop(id(net_connect), None)
+        try:
+            net_connect.disconnect()
+        except Exception as e:
+            logger.error("Error disconnecting from device: %s", e)
+
+    def clear(self) -> None:
+        """Disconnect and drop every pooled connection; the pool stays usable."""
+        with self._lock:
+            entries = list(self._connections.values())
+            self._connections.clear()
+        for net_connect, _ in entries:
+            self.discard(net_connect)
+
+    def close_all(self) -> None:
+        """Stop the idle sweeper and disconnect every pooled connection."""
+        self._closed.set()
+        self.clear()
+
+
+connection_pool = ConnectionPool()
+# Pooled sessions outlive individual runs; log out cleanly when the app exits
+atexit.register(connection_pool.close_all)
+
+
 class NetmikoWorker(QtCore.QThread):
     """Worker thread for executing network device commands."""
     
     # Use slots to reduce memory usage
     __slots__ = (
-        'settings', 'devices_info', 'commands', 'is_running',
+        'settings', 'devices_info', 'commands', 'valid_commands', 'stop_event',
         'is_config_mode', '_lock', 'pause_event', '_error_patterns'
     )
 
@@ -113,15 +363,28 @@ class NetmikoWorker(QtCore.QThread):
         "% Ambiguous command",
     }
 
-    # Common command prompts to strip
-    _PROMPT_PATTERNS = {
-        r"[\r\n]+[\w\-\.]+[#>][\s]*$",  # Basic Cisco/Linux style (hostname# or hostname>)
-        r"[\r\n]+\S+@\S+:[~\w\d\/\-\.]+[#\$][\s]*$",  # Linux/Unix style (user@host:path$)
-        r"[\r\n]+<[\w\-\.]+>[\s]*$",  # Juniper/XML style (<hostname>)
-        r"[\r\n]+\[[\w\-\.]+\][#>][\s]*$",  # Bracket style ([hostname]#)
-        r"[\r\n]+[\w\-\.]+\(config[\w\-\.]*\)#[\s]*$",  # Cisco config mode
-        r"[\r\n]+[\w\-\.]+\([\w\-\.]+\)#[\s]*$",  # General config/context mode
-    }
+    # Same markers as one regex string, as send_config_set's error_pattern expects
+    _ERROR_REGEX = "|".join(re.escape(pattern) for pattern in sorted(_ERROR_PATTERNS))
+
+    # Common command prompts to strip (compiled once, reused for every command)
+    _PROMPT_PATTERNS = tuple(
+        re.compile(pattern)
+        for pattern in (
+            r"[\r\n]+[\w\-\.]+[#>][\s]*$",  # Basic Cisco/Linux style (hostname# or hostname>)
+            r"[\r\n]+\S+@\S+:[~\w\d\/\-\.]+[#\$][\s]*$",  # Linux/Unix style (user@host:path$)
+            r"[\r\n]+<[\w\-\.]+>[\s]*$",  # Juniper/XML style (<hostname>)
+            r"[\r\n]+\[[\w\-\.]+\][#>][\s]*$",  # Bracket style ([hostname]#)
+            r"[\r\n]+[\w\-\.]+\(config[\w\-\.]*\)#[\s]*$",  # Cisco config mode
+            r"[\r\n]+[\w\-\.]+\([\w\-\.]+\)#[\s]*$",  # General config/context mode
+        )
+    )
+
+    # Prompt ending send_command waits for after each command
+    _EXPECT_PROMPT = r"[#>$\]][\s]*$"
+
+    # Cap per-command output kept in memory and sent to the UI (characters).
+    # Stays well under the 10MB CSV field limit used when viewing results.
+    _MAX_OUTPUT_CHARS = 5 * 1024 * 1024
 
     def __init__(self, devices_info: List[dict], commands: List[str], is_config_mode: bool = False):
         """Initialize the NetmikoWorker thread.
@@ -135,111 +398,138 @@ class NetmikoWorker(QtCore.QThread):
         self.settings = self._load_network_settings()
         self.devices_info = devices_info
         self.commands = commands
-        self.is_running = True
+        self.valid_commands = []  # Filled once per run by run()
+        self.stop_event = threading.Event()  # Set when the user stops the run
         self.is_config_mode = is_config_mode
         self._lock = threading.Lock()
         self.pause_event = threading.Event()
         self.pause_event.set()  # Initially not paused
         self._error_patterns = self._ERROR_PATTERNS
 
-    @functools.lru_cache(maxsize=1)
     def _load_network_settings(self) -> dict:
-        """Load and cache network settings from JSON file."""
-        default_settings = {
-            'ssh_timeout': 3,
-            'conn_retry': 30,
-            'cmd_timeout': 120,
-            'auth_timeout': 30,
-            'max_threads': 10,
-            'batch_size': 5
-        }
-        
+        """Load network settings, re-parsing the JSON file only when it changes."""
         try:
-            if os.path.exists('network_settings.json'):
-                with open('network_settings.json', 'r') as f:
-                    settings = json.load(f)
-                    return {
-                        'ssh_timeout': settings.get('ssh_timeout', default_settings['ssh_timeout']),
-                        'conn_retry': settings.get('conn_retry', default_settings['conn_retry']),
-                        'cmd_timeout': settings.get('cmd_timeout', default_settings['cmd_timeout']),
-                        'auth_timeout': settings.get('auth_timeout', default_settings['auth_timeout']),
-                        'max_threads': settings.get('max_threads', default_settings['max_threads']),
-                        'batch_size': settings.get('batch_size', default_settings['batch_size'])
-                    }
-        except Exception as e:
-            logger.error(f"Error loading network settings: {e}")
-        
-        return default_settings
+            mtime_ns = os.stat(NETWORK_SETTINGS_FILE).st_mtime_ns
+        except OSError:
+            mtime_ns = None  # No settings file; use defaults
+        return dict(_read_network_settings(mtime_ns))
 
     def check_ssh_port(self, host, port=22, timeout=None):
         """Check if the SSH port is accessible."""
         timeout = timeout or self.settings['ssh_timeout']
         try:
             with socket.create_connection((host, port), timeout=timeout):
-                logger.info(f"SSH port {port} on {host} is accessible.")
+                logger.info("SSH port %s on %s is accessible.", port, host)
                 return True
         except socket.timeout:
-            logger.error(f"Timeout while checking SSH port {port} on {host}.")
+            logger.error("Timeout while checking SSH port %s on %s.", port, host)
         except socket.error as e:
             logger.error(
-                f"Socket error while checking SSH port {port} on {host}: {e}"
+                "Socket error while checking SSH port %s on %s: %s", port, host, e
             )
         return False
 
     @contextlib.contextmanager
     def device_connection(self, device_info: dict):
         """Context manager for handling device connections."""
-        net_connect = None
+        session = None
+        completed = False
         try:
-            net_connect = ConnectHandler(**device_info)
-            yield net_connect
+            session = PooledSession(connection_pool.acquire(device_info))
+            yield session
+            completed = True
         finally:
-            if net_connect:
-                try:
-                    net_connect.disconnect()
-                except Exception as e:
-                    logger.error(f"Error disconnecting from device: {e}")
+            if session:
+                # Only hand back sessions that finished cleanly and are back
+                # at the exec prompt; a failed command may have left the
+                # channel mid-output or the device in config mode
+                if (
+                    completed
+                    and session.clean
+                    and self._reset_for_reuse(session.connection, device_info["host"])
+                ):
+                    connection_pool.release(device_info, session.connection)
+                else:
+                    connection_pool.discard(session.connection)
+
+    def _reset_for_reuse(self, net_connect, host) -> bool:
+        """Return a session to a clean exec prompt; False if it can't be reused."""
+        try:
+            # Only config runs enter config mode; on some platforms (e.g.
+            # Linux as root) the check would misread a normal prompt
+            if self.is_config_mode and net_connect.check_config_mode():
+                net_connect.exit_config_mode()
+            net_connect.clear_buffer()
+            return True
+        except Exception as e:
+            logger.warning("Not reusing session to %s: %s", host, e)
+            return False
 
     @log_execution_time
-    @retry_on_exception(retries=3)
+    @retry_on_exception(retries=3, stop_event_attr="stop_event")
     def process_device(self, device_info: dict) -> Optional[bool]:
         """Process a single device with retries and timing."""
-        if not self.is_running:
+        from netmiko.exceptions import (
+            NetmikoAuthenticationException,
+            NetmikoTimeoutException,
+        )
+        from paramiko.ssh_exception import SSHException
+
+        if self.stop_event.is_set():
             return None
 
+        host = device_info["host"]
+        username = device_info.get("username", "Unknown_User")
+
+        # Resolve once so the port check and SSH dial skip repeat DNS lookups
+        try:
+            addresses = resolve_host(host)
+        except (OSError, UnicodeError) as e:
+            # Bad names (e.g. "router..lab" raises UnicodeError) won't
+            # resolve on a retry either, so fail the device immediately
+            error_msg = f"Could not resolve {host}: {e}"
+            logger.error("Could not resolve %s: %s", host, e)
+            self.output_ready.emit(username, host, "CONNECTION ERROR", error_msg)
+            return False
+
         # Prepare device connection info
         connection_info = {
             **device_info,
             "fast_cli": False,
+            # TCP dial uses the same budget as the port check that precedes it
+            "conn_timeout": self.settings['ssh_timeout'],
             "timeout": self.settings['auth_timeout'],
             "banner_timeout": self.settings['auth_timeout'],
             "auth_timeout": self.settings['auth_timeout'],
+            "keepalive": 30,
         }
 
-        host = device_info["host"]
-        username = device_info.get("username", "Unknown_User")
         retries = max(1, self.settings['conn_retry'] // 15)
 
         for attempt in range(1, retries + 1):
-            if not self.is_running:
+            if self.stop_event.is_set():
                 logger.info("Thread stopped before completion.")
                 return None
 
             try:
                 # Log connection attempt
                 logger.info(
-                    f"Attempt {attempt}/{retries}: "
-                    f"Initiating connection to {host}..."
+                    "Attempt %d/%d: Initiating connection to %s...",
+                    attempt, retries, host
                 )
                 self.progress_update.emit(
                     f"Establishing connection with {host} "
                     f"(Attempt {attempt}/{retries})..."
                 )
 
-                # Check SSH port accessibility
-                if not self.check_ssh_port(host):
+                # Check SSH port accessibility, falling back through every
+                # resolved address (e.g. IPv4 when IPv6 is unreachable)
+                address = next(
+                    (addr for addr in addresses if self.check_ssh_port(addr)), None
+                )
+                if address is None:
                     error_msg = f"SSH port 22 is not accessible on {host}"
-                    logger.error(error_msg)
+                    logger.error("SSH port 22 is not accessible on %s", host)
                     self.output_ready.emit(
                         username,
                         host,
@@ -249,19 +539,26 @@ class NetmikoWorker(QtCore.QThread):
                     return None
 
                 # Use context manager for device connection
-                with self.device_connection(connection_info) as net_connect:
-                    if not self.is_running:
+                with self.device_connection(
+                    {**connection_info, "host": address}
+                ) as session:
+                    if self.stop_event.is_set():
                         logger.info("Thread interrupted after connection.")
                         return None
 
-                    logger.info(f"Connected to {host} on attempt {attempt}.")
+                    logger.info("Connected to %s on attempt %d.", host, attempt)
                     self.progress_update.emit(f"Connected to {host}.")
 
-                    # Execute commands based on mode
+                    # Execute commands based on mode; a failure keeps the
+                    # session out of the pool
                     if self.is_config_mode:
-                        self.execute_config_commands(net_connect, username, device_info)
+                        session.clean = self.execute_config_commands(
+                            session.connection, username, device_info
+                        )
                     else:
-                        self.execute_normal_commands(net_connect, username, device_info)
+                        session.clean = self.execute_normal_commands(
+                            session.connection, username, device_info
+                        )
 
                 return True
 
@@ -280,15 +577,26 @@ class NetmikoWorker(QtCore.QThread):
                 self.handle_error("CRITICAL ERROR", host, e)
                 return False
 
+            # Transient failure: back off before the next attempt so many
+            # devices on a flaky segment don't all retry in lockstep
+            delay = backoff_delay(attempt)
+            logger.info("Retrying %s in %.1f seconds...", host, delay)
+            if self.stop_event.wait(delay):
+                logger.info("Thread stopped during retry backoff.")
+                return None
+
         return False
 
     @log_execution_time
     def run(self):
         """Main execution logic for the thread using thread pool with device-based batch processing."""
         try:
-            settings = self._load_network_settings()  # Use cached settings
-            max_workers = settings['max_threads']
-            batch_size = settings['batch_size']
+            # Pick up DNS changes made since the last run
+            resolve_host.cache_clear()
+
+            # Settings were read once in __init__
+            max_workers = self.settings['max_threads']
+            batch_size = self.settings['batch_size']
 
             # Pre-validate devices and commands
             if not self.devices_info:
@@ -300,6 +608,8 @@ class NetmikoWorker(QtCore.QThread):
             valid_commands = [cmd for cmd in self.commands if isinstance(cmd, str) and cmd.strip()]
             if not valid_commands:
                 raise ValueError("No valid commands to execute")
+            # Shared by every device so the list isn't re-filtered per device
+            self.valid_commands = valid_commands
 
             # Create device batches for parallel processing
             device_batches = [
@@ -310,24 +620,30 @@ class NetmikoWorker(QtCore.QThread):
             total_devices = len(self.devices_info)
             total_batches = len(device_batches)
             logger.info(
-                f"Processing {total_devices} devices in {total_batches} batches "
-                f"({len(valid_commands)} commands per device)"
+                "Processing %d devices in %d batches (%d commands per device)",
+                total_devices, total_batches, len(valid_commands)
             )
             self.progress_update.emit(
                 f"Starting execution with {total_devices} devices..."
             )
 
+            # At most one batch is in flight, so threads beyond the batch
+            # size (or the device count) would never receive work
+            max_workers = min(max_workers, batch_size, total_devices)
+
             # Process device batches with thread pool
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="netmate-device"
+            ) as executor:
                 for batch_num, device_batch in enumerate(device_batches, 1):
-                    if not self.is_running:
+                    if self.stop_event.is_set():
                         logger.info("Execution stopped by user")
                         break
 
                     batch_size = len(device_batch)
                     logger.info(
-                        f"Processing device batch {batch_num}/{total_batches} "
-                        f"({batch_size} devices, {len(valid_commands)} commands each)"
+                        "Processing device batch %d/%d (%d devices, %d commands each)",
+                        batch_num, total_batches, batch_size, len(valid_commands)
                     )
                     self.progress_update.emit(
                         f"Processing device batch {batch_num} of {total_batches}..."
@@ -345,7 +661,10 @@ class NetmikoWorker(QtCore.QThread):
 
                     # Process completed device futures
                     for future in as_completed(futures):
-                        if not self.is_running:
+                        if self.stop_event.is_set():
+                            # Drop devices still queued instead of letting
+                            # each one start only to return immediately
+                            executor.shutdown(wait=False, cancel_futures=True)
                             break
 
                         device = futures[future]
@@ -364,8 +683,8 @@ class NetmikoWorker(QtCore.QThread):
 
                     # Log batch completion statistics
                     logger.info(
-                        f"Device batch {batch_num} completed: "
-                        f"{completed} succeeded, {failed} failed"
+                        "Device batch %d completed: %d succeeded, %d failed",
+                        batch_num, completed, failed
                     )
                     self.batch_completed.emit(completed)
 
@@ -374,61 +693,61 @@ class NetmikoWorker(QtCore.QThread):
 
             # Log final statistics
             logger.info(
-                f"Execution completed: {total_devices} devices processed "
-                f"with {len(valid_commands)} commands each"
+                "Execution completed: %d devices processed with %d commands each",
+                total_devices, len(valid_commands)
             )
             self.progress_update.emit("Execution completed")
 
         except Exception as e:
             error_msg = f"Thread pool execution error: {str(e)}"
-            logger.error(error_msg)
+            logger.error("Thread pool execution error: %s", e)
             self.progress_update.emit(error_msg)
             raise
+        finally:
+            flush_log()
 
     @log_execution_time
-    def execute_normal_commands(self, net_connect, username: str, device_info: dict) -> None:
-        """Execute a list of commands in normal mode with optimized error handling."""
+    def execute_normal_commands(self, net_connect, username: str, device_info: dict) -> bool:
+        """Execute a list of commands in normal mode with optimized error handling.
+
+        Returns False if any command raised, since the channel may then hold
+        unread output and must not be reused.
+        """
         host = device_info["host"]
-        total_commands = len(self.commands)
+        clean = True
+        valid_commands = self.valid_commands
+        total_commands = len(valid_commands)
         
-        logger.info(f"Executing {total_commands} commands on {host}")
+        logger.info("Executing %d commands on %s", total_commands, host)
         self.progress_update.emit(f"Executing commands on {host}...")
 
-        # Pre-validate commands
-        valid_commands = [cmd for cmd in self.commands if isinstance(cmd, str) and cmd.strip()]
-        if not valid_commands:
-            self.handle_error(
-                "VALIDATION ERROR",
-                host,
-                "No valid commands to execute"
-            )
-            return
-
         for index, command in enumerate(valid_commands, 1):
             # Check execution state
             self.pause_event.wait()
-            if not self.is_running:
-                logger.info(f"Command execution stopped on {host}")
-                return
+            if self.stop_event.is_set():
+                logger.info("Command execution stopped on %s", host)
+                return clean
 
             try:
-                # Execute command with timeout and error handling
-                with self._lock:
-                    logger.debug(
-                        f"Executing command {index}/{total_commands} "
-                        f"on {host}: {command}"
-                    )
-                    output = net_connect.send_command(
-                        command,
-                        read_timeout=self.settings['cmd_timeout'],
-                        strip_prompt=True,
-                        strip_command=True,
-                        expect_string=r"[#>$\]][\s]*$"  # Match common prompt endings
-                    )
+                # Execute command with timeout and error handling. Each device
+                # has its own connection, so no lock is needed here; holding
+                # the worker lock would serialize the whole thread pool.
+                logger.debug(
+                    "Executing command %d/%d on %s: %s",
+                    index, total_commands, host, command
+                )
+                output = net_connect.send_command(
+                    command,
+                    read_timeout=self.settings['cmd_timeout'],
+                    strip_prompt=True,
+                    strip_command=True,
+                    expect_string=self._EXPECT_PROMPT  # Match common prompt endings
+                )
 
-                    # Additional prompt stripping for various device types
-                    for pattern in self._PROMPT_PATTERNS:
-                        output = re.sub(pattern, "", output)
+                # Additional prompt stripping for various device types
+                output = self._strip_prompts(output)
+
+                output = self._truncate_output(output, host, command)
 
                 # Validate command output
                 if self.is_invalid_command(output):
@@ -436,7 +755,7 @@ class NetmikoWorker(QtCore.QThread):
                         f"Invalid command: {command}\n"
                         f"Output indicates an error or invalid syntax"
                     )
-                    logger.warning(f"{error_msg} on {host}")
+                    logger.warning("%s on %s", error_msg, host)
                     self.output_ready.emit(
                         username,
                         host,
@@ -456,22 +775,25 @@ class NetmikoWorker(QtCore.QThread):
                 
                 # Log progress
                 logger.debug(
-                    f"Command {index}/{total_commands} completed successfully on {host}"
+                    "Command %d/%d completed successfully on %s",
+                    index, total_commands, host
                 )
 
             except Exception as e:
                 error_msg = f"Failed to execute command: {command}"
-                logger.error(f"{error_msg} on {host}: {str(e)}")
+                logger.error("%s on %s: %s", error_msg, host, e)
                 self.handle_error(
                     "COMMAND ERROR",
                     host,
                     e,
                     command,
                 )
+                clean = False
                 # Continue with next command instead of breaking
                 continue
 
-        logger.info(f"Completed all commands on {host}")
+        logger.info("Completed all commands on %s", host)
+        return clean
 
     @QtCore.pyqtSlot()
     def pause(self):
@@ -492,49 +814,56 @@ class NetmikoWorker(QtCore.QThread):
                 self.progress_update.emit("Execution resumed...")
 
     @log_execution_time
-    def execute_config_commands(self, net_connect, username: str, device_info: dict) -> None:
-        """Execute commands in configuration mode with optimized error handling and logging."""
+    def execute_config_commands(self, net_connect, username: str, device_info: dict) -> bool:
+        """Execute commands in configuration mode with optimized error handling and logging.
+
+        Returns False if anything raised, since the device may still be in
+        config mode and the session must not be reused.
+        """
+        from netmiko.exceptions import ConfigInvalidException
+
         host = device_info["host"]
         
         try:
-            # Pre-validate commands
-            valid_commands = [cmd for cmd in self.commands if isinstance(cmd, str) and cmd.strip()]
+            # Commands were validated once in run()
+            valid_commands = self.valid_commands
             if not valid_commands:
                 raise ValueError("No valid configuration commands found")
 
             total_commands = len(valid_commands)
-            logger.info(f"Executing {total_commands} configuration commands on {host}")
+            logger.info("Executing %d configuration commands on %s", total_commands, host)
             self.progress_update.emit(f"Entering configuration mode on {host}...")
 
             try:
                 # Enter configuration mode with verification
                 if not net_connect.check_config_mode():
-                    logger.debug(f"Entering config mode on {host}")
+                    logger.debug("Entering config mode on %s", host)
                     net_connect.config_mode()
                     if not net_connect.check_config_mode():
                         raise ConfigInvalidException("Failed to enter configuration mode")
 
                 # Execute configuration commands with progress tracking
-                logger.debug(f"Sending configuration commands to {host}")
+                logger.debug("Sending configuration commands to %s", host)
                 output = net_connect.send_config_set(
                     valid_commands,
                     cmd_verify=True,
                     read_timeout=self.settings['cmd_timeout'],
-                    error_pattern=self._ERROR_PATTERNS,  # Use class-level error patterns
-                    expect_string=r"[#>$\]][\s]*$"  # Match common prompt endings
+                    error_pattern=self._ERROR_REGEX,  # Use class-level error patterns
                 )
 
                 # Additional prompt stripping for various device types
-                for pattern in self._PROMPT_PATTERNS:
-                    output = re.sub(pattern, "", output)
+                output = self._strip_prompts(output)
+
+                output = self._truncate_output(output, host, "CONFIG MODE")
 
                 # Safely exit configuration mode
                 try:
                     if net_connect.check_config_mode():
-                        logger.debug(f"Exiting config mode on {host}")
+                        logger.debug("Exiting config mode on %s", host)
                         net_connect.exit_config_mode()
                 except Exception as e:
-                    logger.warning(f"Error exiting config mode on {host}: {e}")
+                    logger.warning("Error exiting config mode on %s: %s", host, e)
+                    return False
 
                 # Validate command output
                 if self.is_invalid_command(output):
@@ -542,7 +871,7 @@ class NetmikoWorker(QtCore.QThread):
                         "One or more configuration commands resulted in error.\n"
                         "Please check the output for specific error messages."
                     )
-                    logger.error(f"Configuration error on {host}: {error_msg}")
+                    logger.error("Configuration error on %s: %s", host, error_msg)
                     self.handle_error(
                         "CONFIG INVALID ERROR",
                         host,
@@ -550,7 +879,7 @@ class NetmikoWorker(QtCore.QThread):
                     )
                 else:
                     # Process successful output
-                    logger.info(f"Successfully executed {total_commands} configuration commands on {host}")
+                    logger.info("Successfully executed %d configuration commands on %s", total_commands, host)
                     self.output_ready.emit(
                         username,
                         host,
@@ -558,10 +887,11 @@ class NetmikoWorker(QtCore.QThread):
                         output,
                     )
                     self.command_completed.emit()
+                return True
 
             except ConfigInvalidException as e:
                 error_msg = f"Configuration mode error: {str(e)}"
-                logger.error(f"{error_msg} on {host}")
+                logger.error("%s on %s", error_msg, host)
                 self.handle_error(
                     "CONFIG INVALID ERROR",
                     host,
@@ -569,7 +899,7 @@ class NetmikoWorker(QtCore.QThread):
                 )
             except Exception as e:
                 error_msg = f"Failed to execute configuration commands: {str(e)}"
-                logger.error(f"{error_msg} on {host}")
+                logger.error("%s on %s", error_msg, host)
                 self.handle_error(
                     "CONFIG MODE ERROR",
                     host,
@@ -578,7 +908,7 @@ class NetmikoWorker(QtCore.QThread):
 
         except ValueError as e:
             error_msg = f"Configuration validation error: {str(e)}"
-            logger.error(f"{error_msg} on {host}")
+            logger.error("%s on %s", error_msg, host)
             self.handle_error(
                 "CONFIG VALIDATION ERROR",
                 host,
@@ -586,12 +916,33 @@ class NetmikoWorker(QtCore.QThread):
             )
         except Exception as e:
             error_msg = f"Unexpected error in configuration mode: {str(e)}"
-            logger.error(f"{error_msg} on {host}")
+            logger.error("%s on %s", error_msg, host)
             self.handle_error(
                 "CONFIG ERROR",
                 host,
                 error_msg,
             )
+        return False
+
+    def _strip_prompts(self, output):
+        """Remove trailing device prompts left in command output."""
+        for pattern in self._PROMPT_PATTERNS:
+            output = pattern.sub("", output)
+        return output
+
+    def _truncate_output(self, output, host, command):
+        """Trim oversized command output and append a truncation marker."""
+        limit = self._MAX_OUTPUT_CHARS
+        if len(output) <= limit:
+            return output
+        logger.warning(
+            "Output of '%s' on %s truncated from %d to %d characters",
+            command, host, len(output), limit
+        )
+        return (
+            f"{output[:limit]}\n"
+            f"... [output truncated: {len(output) - limit} characters omitted]"
+        )
 
     def _has_error_markers(self, line):
         """Check if a line contains error markers."""
@@ -607,7 +958,9 @@ class NetmikoWorker(QtCore.QThread):
         error_msg = f"{error_type} on {host}: {error}"
         if command:
             error_msg += f" (Command: {command})"
-        logger.error(error_msg)
+            logger.error("%s on %s: %s (Command: %s)", error_type, host, error, command)
+        else:
+            logger.error("%s on %s: %s", error_type, host, error)
         self.output_ready.emit(
             "Unknown_User",  # We don't have device_info in this context
             host,
@@ -617,9 +970,8 @@ class NetmikoWorker(QtCore.QThread):
 
     def stop(self):
         """Gracefully stop the thread and clean up resources."""
-        with self._lock:
-            self.is_running = False
-            self.pause_event.set()  # Ensure the thread can exit if paused
+        self.stop_event.set()
+        self.pause_event.set()  # Ensure the thread can exit if paused
 
         logger.info("Stopping thread...")
         self.progress_update.emit("Thread stopping...")
@@ -1,13 +1,45 @@
 # main.py
 import csv
 import json
+import logging
 import os
+import signal
+import subprocess
 import sys
+import threading
 from datetime import datetime
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
-from handlers import NetmikoWorker
+from handlers import NetmikoWorker, connection_pool, flush_log
+
+logger = logging.getLogger("netmiko")
+
+# Increase CSV field size limit to 10MB so large outputs can be viewed
+csv.field_size_limit(10 * 1024 * 1024)  # 10MB in bytes
+
+# Timestamp formats for display/CSV rows and for default file names
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+FILENAME_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+
+def timestamp_now(fmt=TIMESTAMP_FORMAT):
+    """Return the current local time formatted with ``fmt``."""
+    return datetime.now().strftime(fmt)
+
+
+def reveal_in_file_manager(filename):
+    """Open the folder containing ``filename`` without blocking the GUI."""
+    try:
+        if sys.platform == 'darwin':  # macOS
+            subprocess.Popen(['open', '-R', filename])
+        elif sys.platform == 'linux':  # Linux
+            subprocess.Popen(['xdg-open', os.path.dirname(filename)])
+        else:  # Windows
+            subprocess.Popen(['explorer', '/select,', os.path.normpath(filename)])
+    except OSError as e:
+        # The file is already saved; a missing file manager is not an error
+        logger.warning("Could not open folder for %s: %s", filename, e)
 
 
 def resource_path(relative_path):
@@ -169,10 +201,35 @@ class DeviceManager(QtWidgets.QMainWindow):
         "output": "#CBD5E1",  # Light gray for command output
     }
 
+    # Netmiko device types offered in the Device Type drop-down
+    DEVICE_TYPES = (
+        "arista_eos",
+        "cisco_apic",
+        "cisco_asa",
+        "cisco_ios",
+        "cisco_xe",
+        "cisco_nxos",
+        "cisco_ftd",
+        "f5_linux",
+        "f5_ltm",
+        "f5_tmsh",
+        "fortinet",
+        "juniper_junos",
+        "linux",
+        "paloalto_panos",
+    )
+
+    # Output batching: flush after this many ms or this many queued lines
+    OUTPUT_FLUSH_INTERVAL_MS = 100
+    OUTPUT_FLUSH_MAX_LINES = 50
+    # Oldest lines are dropped from the output area beyond this count
+    OUTPUT_MAX_LINES = 50000
+
     def __init__(self):
         super().__init__()
         self.workers = []
         self.results = []
+        self._close_pending = False  # Window closes once workers finish
         self.completed_commands = 0
         self.total_commands = 0
         self.is_config_mode = False
@@ -192,6 +249,22 @@ class DeviceManager(QtWidgets.QMainWindow):
             "border_radius": 6,
         }
 
+        # Output lines are queued and appended in batches so a chatty run
+        # doesn't trigger a document layout and repaint per line
+        self._output_buffer = []
+        self._output_timer = QtCore.QTimer(self)
+        self._output_timer.setInterval(self.OUTPUT_FLUSH_INTERVAL_MS)
+        self._output_timer.timeout.connect(self._flush_output)
+
+        # Progress bar repaints are coalesced the same way; the last value
+        # is always shown once the timer fires after the final command
+        self._progress_timer = QtCore.QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(self.OUTPUT_FLUSH_INTERVAL_MS)
+        self._progress_timer.timeout.connect(
+            lambda: self.progress_bar.setValue(self.completed_commands)
+        )
+
         self._initUI()
         self._setupConnections()
 
@@ -259,6 +332,10 @@ class DeviceManager(QtWidgets.QMainWindow):
         self.toggle_config_mode_action.setCheckable(True)
         self.toggle_config_mode_action.triggered.connect(self.toggle_config_mode)
 
+        # Log out of SSH sessions kept open for reuse between runs
+        close_sessions_action = options_menu.addAction("Close All Sessions")
+        close_sessions_action.triggered.connect(self.close_all_sessions)
+
         # Create submenus under File menu
         credentials_submenu = file_menu.addMenu("Credentials")
         session_submenu = file_menu.addMenu("Session")
@@ -318,24 +395,7 @@ class DeviceManager(QtWidgets.QMainWindow):
         device_type_label = QtWidgets.QLabel("Device Type:")
         self.device_type = QtWidgets.QComboBox()
         self.device_type.setSizePolicy(self.expanding_fixed)
-        self.device_type.addItems(
-            [
-                "arista_eos",
-                "cisco_apic",
-                "cisco_asa",
-                "cisco_ios",
-                "cisco_xe",
-                "cisco_nxos",
-                "cisco_ftd",
-                "f5_linux",
-                "f5_ltm",
-                "f5_tmsh",
-                "fortinet",
-                "juniper_junos",
-                "linux",
-                "paloalto_panos",
-            ]
-        )
+        self.device_type.addItems(self.DEVICE_TYPES)
 
         # Add fields to credentials layout
         credentials_layout.addWidget(username_label)
@@ -405,9 +465,11 @@ class DeviceManager(QtWidgets.QMainWindow):
 
         # Create output area with size policy
         output_label = QtWidgets.QLabel("Output:")
-        self.output_area = QtWidgets.QTextEdit()
+        # Plain text avoids rich-text layout on every append; the line cap
+        # keeps memory and reflow cost bounded on long runs
+        self.output_area = QtWidgets.QPlainTextEdit()
         self.output_area.setReadOnly(True)
-        self.output_area.setAcceptRichText(True)
+        self.output_area.setMaximumBlockCount(self.OUTPUT_MAX_LINES)
         self.output_area.setSizePolicy(self.expanding_both)
         self.output_area.setMinimumHeight(200)
 
@@ -462,9 +524,21 @@ class DeviceManager(QtWidgets.QMainWindow):
         placeholder = f"Enter commands to execute ({mode} Mode)\n(one per line)"
         self.commands_input.setPlaceholderText(placeholder)
 
+    def close_all_sessions(self):
+        """Disconnect every idle pooled SSH session."""
+        # Each logout can take a few seconds; keep it off the GUI thread.
+        # Sessions checked out by a running worker are not affected.
+        threading.Thread(
+            target=connection_pool.clear, name="close-sessions", daemon=True
+        ).start()
+        timestamp = timestamp_now()
+        self._append_output(f"[{timestamp}] Closing all idle SSH sessions")
+        self._append_output("")
+
     def view_log(self):
         """View the contents of netmiko.log file."""
         try:
+            flush_log()
             if os.path.exists("netmiko.log"):
                 with open("netmiko.log", "r", encoding="utf-8") as f:
                     log_content = f.read()
@@ -479,7 +553,7 @@ class DeviceManager(QtWidgets.QMainWindow):
 
                 # Create log text area with proper size policies
                 expanding = QtWidgets.QSizePolicy.Policy.Expanding
-                log_text = QtWidgets.QTextEdit()
+                log_text = QtWidgets.QPlainTextEdit()
                 log_text.setReadOnly(True)
                 log_text.setPlainText(log_content)
                 log_text.setSizePolicy(expanding, expanding)
@@ -524,6 +598,8 @@ class DeviceManager(QtWidgets.QMainWindow):
                 )
 
                 if reply == QtWidgets.QMessageBox.StandardButton.Yes:
+                    # Write out pending records first so they are cleared too
+                    flush_log()
                     # Clear the log file and write a timestamp
                     with open(log_file, "w", encoding="utf-8") as f:
                         f.write(f"# Log cleared on {datetime.now()}\n")
@@ -543,63 +619,80 @@ class DeviceManager(QtWidgets.QMainWindow):
         self.clear_btn.clicked.connect(self.clear_output)
         self.stop_btn.clicked.connect(self.stop_execution)
 
+    def _append_output(self, text):
+        """Queue a line for the output area; it is appended on the next flush."""
+        self._output_buffer.append(text)
+        if len(self._output_buffer) >= self.OUTPUT_FLUSH_MAX_LINES:
+            self._flush_output()
+        elif not self._output_timer.isActive():
+            self._output_timer.start()
+
+    def _flush_output(self):
+        """Append all queued lines to the output area in a single update."""
+        self._output_timer.stop()
+        if not self._output_buffer:
+            return
+        text = "\n".join(self._output_buffer)
+        self._output_buffer.clear()
+
+        # Move cursor to end
+        cursor = self.output_area.textCursor()
+        cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+        self.output_area.setTextCursor(cursor)
+        self.output_area.appendPlainText(text)
+
+    def _clear_output_area(self):
+        """Discard queued lines and clear the output area."""
+        self._output_timer.stop()
+        self._output_buffer.clear()
+        self.output_area.clear()
+
     def handle_output(self, username, host, command, output):
+        timestamp = timestamp_now()
+
         # Store result in the same format for CSV
         result = {
             "username": username,
             "host": host,
             "command": command,
             "output": output,
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": timestamp,
         }
         self.results.append(result)
 
-        # Move cursor to end
-        cursor = self.output_area.textCursor()
-        cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
-        self.output_area.setTextCursor(cursor)
-
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
         # Display output in the same clean format as CSV
-        if "CONNECTION ERROR" in command or "ERROR" in command:
-            self.output_area.append(f"[{timestamp}] {host}: {output}")
+        if "ERROR" in command:  # Covers CONNECTION ERROR and the other error types
+            self._append_output(f"[{timestamp}] {host}: {output}")
         else:
             # First line shows timestamp, host, and command
-            self.output_area.append(f"[{timestamp}] {host}: {command}")
+            self._append_output(f"[{timestamp}] {host}: {command}")
             # Then show the command output
-            self.output_area.append(f"{output}")
+            self._append_output(output)
         # Add a newline for separation
-        self.output_area.append("")
+        self._append_output("")
 
     def handle_progress(self, message):
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        cursor = self.output_area.textCursor()
-        cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
-        self.output_area.setTextCursor(cursor)
+        timestamp = timestamp_now()
         # Format progress messages in clean format
-        self.output_area.append(f"[{timestamp}] {message}")
-        self.output_area.append("")
+        self._append_output(f"[{timestamp}] {message}")
+        self._append_output("")
 
     def update_progress(self):
         """Update progress bar when a command is completed."""
         self.completed_commands += 1
-        self.progress_bar.setValue(self.completed_commands)
-        # Update progress text
-        percent = int((self.completed_commands / self.total_commands) * 100)
-        progress_text = (
-            f"{percent}% ({self.completed_commands}/{self.total_commands} commands)"
-        )
-        self.progress_bar.setFormat(progress_text)
+        # Repaint at most once per flush interval; the progress text comes
+        # from the "%p% (%v/%m commands)" format set in run_commands
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
 
     def run_commands(self):
         # Validate credentials
         username = self.username_input.text().strip()
         password = self.password_input.text().strip()
         if not username or not password:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.output_area.append(f"[{timestamp}] ERROR: Please enter username and password")
-            self.output_area.append("")
+            timestamp = timestamp_now()
+            self._append_output(f"[{timestamp}] ERROR: Please enter username and password")
+            self._append_output("")
             QtWidgets.QMessageBox.warning(
                 self, "Error", "Please enter username and password"
             )
@@ -608,53 +701,53 @@ class DeviceManager(QtWidgets.QMainWindow):
         # Validate devices
         devices_text = self.devices_input.toPlainText().strip()
         if not devices_text:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.output_area.append(f"[{timestamp}] ERROR: Please enter at least one device")
-            self.output_area.append("")
+            timestamp = timestamp_now()
+            self._append_output(f"[{timestamp}] ERROR: Please enter at least one device")
+            self._append_output("")
             QtWidgets.QMessageBox.warning(
                 self, "Error", "Please enter at least one device"
             )
             return
 
         # Parse and validate devices
-        devices = [d.strip() for d in devices_text.split("\n") if d.strip()]
+        devices = [d for d in map(str.strip, devices_text.splitlines()) if d]
         if not devices:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.output_area.append(f"[{timestamp}] ERROR: No valid devices found")
-            self.output_area.append("")
+            timestamp = timestamp_now()
+            self._append_output(f"[{timestamp}] ERROR: No valid devices found")
+            self._append_output("")
             QtWidgets.QMessageBox.warning(self, "Error", "No valid devices found")
             return
 
         # Validate commands
         commands_text = self.commands_input.toPlainText().strip()
         if not commands_text:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.output_area.append(f"[{timestamp}] ERROR: Please enter at least one command")
-            self.output_area.append("")
+            timestamp = timestamp_now()
+            self._append_output(f"[{timestamp}] ERROR: Please enter at least one command")
+            self._append_output("")
             QtWidgets.QMessageBox.warning(
                 self, "Error", "Please enter at least one command"
             )
             return
 
         # Parse and validate commands
-        commands = [c.strip() for c in commands_text.split("\n") if c.strip()]
+        commands = [c for c in map(str.strip, commands_text.splitlines()) if c]
         if not commands:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.output_area.append(f"[{timestamp}] ERROR: No valid commands found")
-            self.output_area.append("")
+            timestamp = timestamp_now()
+            self._append_output(f"[{timestamp}] ERROR: No valid commands found")
+            self._append_output("")
             QtWidgets.QMessageBox.warning(self, "Error", "No valid commands found")
             return
 
         # Clear output and initialize progress
-        self.output_area.clear()
+        self._clear_output_area()
         self.results.clear()  # Clear previous results
 
         # Show start message
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = timestamp_now()
         mode_str = "Configuration" if self.is_config_mode else "Normal"
-        self.output_area.append(f"[{timestamp}] Starting execution in {mode_str} Mode")
-        self.output_area.append(f"Devices: {len(devices)}, Commands: {len(commands)}")
-        self.output_area.append("")
+        self._append_output(f"[{timestamp}] Starting execution in {mode_str} Mode")
+        self._append_output(f"Devices: {len(devices)}, Commands: {len(commands)}")
+        self._append_output("")
 
         # Initialize progress tracking
         self.completed_commands = 0
@@ -672,13 +765,13 @@ class DeviceManager(QtWidgets.QMainWindow):
         self.run_btn.setEnabled(False)
 
         # Create list of device info dictionaries
+        device_type = self.device_type.currentText()
+        credentials = {
+            "username": self.username_input.text(),
+            "password": self.password_input.text(),
+        }
         devices_info = [
-            {
-                "device_type": self.device_type.currentText(),
-                "host": device.strip(),
-                "username": self.username_input.text(),
-                "password": self.password_input.text(),
-            }
+            {"device_type": device_type, "host": device, **credentials}
             for device in devices
         ]
 
@@ -687,22 +780,10 @@ class DeviceManager(QtWidgets.QMainWindow):
         worker.output_ready.connect(self.handle_output)
         worker.progress_update.connect(self.handle_progress)
         worker.command_completed.connect(self.update_progress)
-        worker.batch_completed.connect(self.handle_batch_completed)
         worker.finished.connect(lambda w=worker: self.handle_worker_finished(w))
         self.workers.append(worker)
         worker.start()
 
-    def handle_batch_completed(self, completed_count):
-        """Handle completion of a device batch."""
-        self.completed_commands += completed_count
-        self.progress_bar.setValue(self.completed_commands)
-        # Update progress text
-        percent = int((self.completed_commands / self.total_commands) * 100)
-        progress_text = (
-            f"{percent}% ({self.completed_commands}/{self.total_commands} commands)"
-        )
-        self.progress_bar.setFormat(progress_text)
-
     def handle_worker_finished(self, worker):
         if worker in self.workers:
             self.workers.remove(worker)
@@ -712,9 +793,11 @@ class DeviceManager(QtWidgets.QMainWindow):
             self.pause_btn.setEnabled(False)  # Disable Pause button
             self.stop_btn.setEnabled(False)  # Disable Stop button
             self.progress_bar.hide()
-            ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.output_area.append(f"[{ts}] Done")
-            self.output_area.append("")
+            ts = timestamp_now()
+            self._append_output(f"[{ts}] Done")
+            self._append_output("")
+            if self._close_pending:
+                self.close()
 
     def toggle_pause(self):
         """Toggle the pause state of the workers."""
@@ -729,18 +812,7 @@ class DeviceManager(QtWidgets.QMainWindow):
             # Change button to 'Resume' and pause workers
             self.pause_btn.setText("Resume")
             self.pause_btn.setObjectName("resume_btn")  # Change style
-            self.pause_btn.setStyleSheet("""
-                #resume_btn {
-                    background-color: #3b82f6;
-                    border: 1px solid #2563eb;
-                }
-                #resume_btn:hover {
-                    background-color: #2563eb;
-                }
-                #resume_btn:pressed {
-                    background-color: #1d4ed8;
-                }
-            """)
+            self._repolish(self.pause_btn)
             for worker in self.workers:
                 if worker.isRunning():
                     worker.pause()
@@ -748,31 +820,55 @@ class DeviceManager(QtWidgets.QMainWindow):
             # Change button to 'Pause' and resume workers
             self.pause_btn.setText("Pause")
             self.pause_btn.setObjectName("pause_btn")  # Restore original style
-            self.pause_btn.setStyleSheet("")  # Remove custom style to use QSS
+            self._repolish(self.pause_btn)
             for worker in self.workers:
                 if worker.isRunning():
                     worker.resume()
 
+    def _repolish(self, widget):
+        """Re-apply the application QSS after a widget's object name changes."""
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+
     def stop_execution(self):
-        """Stops all worker threads."""
+        """Signal all worker threads to stop without blocking the GUI."""
         for worker in self.workers:
             if worker.isRunning():
-                worker.stop()  # Signal the thread to stop
-                worker.wait()  # Wait for the thread to finish
-
-        self.workers.clear()  # Clear the workers list
+                # Cleanup happens in handle_worker_finished once the thread
+                # exits; waiting here would freeze the UI for up to cmd_timeout
+                worker.stop()
 
-        self.run_btn.setEnabled(True)
+        if not self.workers:
+            self.run_btn.setEnabled(True)
+            self.progress_bar.hide()
         self.pause_btn.setEnabled(False)
         self.stop_btn.setEnabled(False)
-        self.progress_bar.hide()
 
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.output_area.append(f"[{timestamp}] Execution stopped by user")
-        self.output_area.append("")
+        timestamp = timestamp_now()
+        self._append_output(f"[{timestamp}] Execution stopped by user")
+        self._append_output("")
+
+    def closeEvent(self, event):
+        """Stop running workers and close once they have logged out."""
+        if self.workers:
+            # Waiting here would freeze the UI for up to cmd_timeout; the
+            # window is closed from handle_worker_finished instead
+            if not self._close_pending:
+                self._close_pending = True
+                self.run_btn.setEnabled(False)
+                for worker in self.workers:
+                    worker.stop()
+                timestamp = timestamp_now()
+                self._append_output(
+                    f"[{timestamp}] Waiting for running tasks to stop before closing..."
+                )
+            event.ignore()
+            return
+        super().closeEvent(event)
 
     def clear_output(self):
-        self.output_area.clear()
+        self._clear_output_area()
         self.results.clear()
         self.progress_bar.hide()
 
@@ -780,7 +876,7 @@ class DeviceManager(QtWidgets.QMainWindow):
         """Save the current session state to a JSON file."""
         try:
             # Create default filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = timestamp_now(FILENAME_TIMESTAMP_FORMAT)
             default_filename = f"netmate_session_{timestamp}.json"
             
             filename, _ = QtWidgets.QFileDialog.getSaveFileName(
@@ -788,6 +884,7 @@ class DeviceManager(QtWidgets.QMainWindow):
             )
 
             if filename:
+                self._flush_output()
                 # Get current session state
                 session = {
                     "username": self.username_input.text(),
@@ -800,15 +897,14 @@ class DeviceManager(QtWidgets.QMainWindow):
                     "results": self.results,
                     "completed_commands": self.completed_commands,
                     "total_commands": self.total_commands,
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    "timestamp": timestamp_now()
                 }
 
-                # Ensure directory exists
-                os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
-
-                # Save to file with proper encoding
+                # Encode in one pass and write once; json.dump would issue a
+                # write() per token, which adds up with large saved outputs
+                data = json.dumps(session, indent=2, ensure_ascii=False)
                 with open(filename, "w", encoding="utf-8") as f:
-                    json.dump(session, f, indent=2, ensure_ascii=False)
+                    f.write(data)
 
                 # Show success message with file path
                 QtWidgets.QMessageBox.information(
@@ -818,12 +914,7 @@ class DeviceManager(QtWidgets.QMainWindow):
                 )
                 
                 # Open the containing folder
-                if sys.platform == 'darwin':  # macOS
-                    os.system(f'open -R "{filename}"')
-                elif sys.platform == 'linux':  # Linux
-                    os.system(f'xdg-open "{os.path.dirname(filename)}"')
-                else:  # Windows
-                    os.system(f'explorer /select,"{filename}"')
+                reveal_in_file_manager(filename)
                     
         except Exception as e:
             QtWidgets.QMessageBox.critical(
@@ -861,6 +952,7 @@ class DeviceManager(QtWidgets.QMainWindow):
 
                 # Restore output and results if available
                 if "output" in session:
+                    self._clear_output_area()
                     self.output_area.setPlainText(session["output"])
                 if "results" in session:
                     self.results = session["results"]
@@ -976,7 +1068,7 @@ class DeviceManager(QtWidgets.QMainWindow):
 
         try:
             # Create default filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = timestamp_now(FILENAME_TIMESTAMP_FORMAT)
             default_filename = f"netmate_results_{timestamp}.csv"
             
             filename, _ = QtWidgets.QFileDialog.getSaveFileName(
@@ -984,11 +1076,11 @@ class DeviceManager(QtWidgets.QMainWindow):
             )
 
             if filename:
-                # Ensure directory exists
-                os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
-
-                # Save to file with proper encoding
-                with open(filename, "w", encoding="utf-8", newline="") as f:
+                # Save to file with proper encoding; a large buffer keeps
+                # multi-megabyte outputs from being written in 8KB pieces
+                with open(
+                    filename, "w", encoding="utf-8", newline="", buffering=1 << 20
+                ) as f:
                     writer = csv.DictWriter(
                         f,
                         fieldnames=[
@@ -1010,12 +1102,7 @@ class DeviceManager(QtWidgets.QMainWindow):
                 )
                 
                 # Open the containing folder
-                if sys.platform == 'darwin':  # macOS
-                    os.system(f'open -R "{filename}"')
-                elif sys.platform == 'linux':  # Linux
-                    os.system(f'xdg-open "{os.path.dirname(filename)}"')
-                else:  # Windows
-                    os.system(f'explorer /select,"{filename}"')
+                reveal_in_file_manager(filename)
 
         except Exception as e:
             QtWidgets.QMessageBox.critical(
@@ -1025,20 +1112,17 @@ class DeviceManager(QtWidgets.QMainWindow):
     def view_results(self):
         """Display the results CSV in a properly formatted table."""
         try:
-            # Increase CSV field size limit to 10MB
-            csv.field_size_limit(10 * 1024 * 1024)  # 10MB in bytes
-
             # Path to the CSV file
             filename, _ = QtWidgets.QFileDialog.getOpenFileName(
                 self, "Open Results File", "", "CSV Files (*.csv)"
             )
 
             if filename:  # Check if the user selected a file
-                # Read the CSV content
-                with open(filename, "r", encoding="utf-8") as file:
-                    reader = csv.DictReader(file)
-                    headers = reader.fieldnames  # Get headers
-                    data = [row for row in reader]  # Read rows as dictionaries
+                # Read the CSV content as plain rows (no dict per row)
+                with open(filename, "r", encoding="utf-8", newline="") as file:
+                    reader = csv.reader(file)
+                    headers = next(reader, [])  # Get headers
+                    data = list(reader)
 
                 # Create a dialog window
                 dialog = QtWidgets.QDialog(self)
@@ -1056,23 +1140,23 @@ class DeviceManager(QtWidgets.QMainWindow):
                 table.setColumnCount(len(headers))
                 table.setHorizontalHeaderLabels(headers)
 
+                # Cell alignment and flags are the same for every item
+                alignment = QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignTop
+                flags = (
+                    QtCore.Qt.ItemFlag.ItemIsSelectable | 
+                    QtCore.Qt.ItemFlag.ItemIsEnabled
+                )
+                output_col = headers.index("output") if "output" in headers else -1
+                column_count = len(headers)
+
                 # Populate the table
                 for row_idx, row in enumerate(data):
-                    for col_idx, header in enumerate(headers):
-                        value = row[header]  # Get cell value
+                    for col_idx, value in enumerate(row[:column_count]):
                         # Handle multiline output
-                        if header == "output":
+                        if col_idx == output_col:
                             value = value.replace("\\n", "\n")
                         item = QtWidgets.QTableWidgetItem(value.strip())
-                        # Set text alignment
-                        alignment = QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignTop
                         item.setTextAlignment(alignment)
-
-                        # Set item flags
-                        flags = (
-                            QtCore.Qt.ItemFlag.ItemIsSelectable | 
-                            QtCore.Qt.ItemFlag.ItemIsEnabled
-                        )
                         item.setFlags(flags)
                         table.setItem(row_idx, col_idx, item)
 
@@ -1124,4 +1208,12 @@ if __name__ == "__main__":
     # Initialize and show the main window
     window = DeviceManager()
     window.show()
+
+    # Ctrl+C in the launching terminal closes the window, stopping workers.
+    # Python only runs signal handlers between Qt events, so keep waking it.
+    signal.signal(signal.SIGINT, lambda *_: window.close())
+    sigint_timer = QtCore.QTimer()
+    sigint_timer.timeout.connect(lambda: None)
+    sigint_timer.start(200)
+
     sys.exit(app.exec())